@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 from importlib import metadata
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import typer
-
-from . import main
+if TYPE_CHECKING:  # typer is only needed at runtime inside the helpers below
+    import typer
 
 __all__ = ["get_version", "build_cli", "run"]
 
@@ -28,9 +27,13 @@ def get_version(distribution_name: str = "cryptocontainer-lab") -> str:
         return "0.1.0"
 
 
-def build_cli(help_text: Optional[str] = None) -> typer.Typer:
+def build_cli(help_text: Optional[str] = None) -> "typer.Typer":
     """Construct a Typer application embedding the default commands."""
 
+    import typer
+
+    from . import main
+
     app = typer.Typer(help=help_text or "CLI для сканирования криптоконтейнеров")
     app.add_typer(main.app)
     return app
@@ -39,4 +42,6 @@ def build_cli(help_text: Optional[str] = None) -> typer.Typer:
 def run() -> None:
     """Entry point for invoking the CLI from Python code."""
 
+    from . import main
+
     main.app()
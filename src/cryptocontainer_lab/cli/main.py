@@ -1,32 +1,44 @@
 """Command line interface for disk scanning."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.table import Table
-
-from ..core.models import ContainerType
-from ..detector.scanner import scan_path_for_containers
 
 app = typer.Typer(help="Сканирование дисков на наличие криптоконтейнеров")
-console = Console()
+
+
+@lru_cache(maxsize=1)
+def _console():
+    # rich is imported lazily so `version`/`--help` don't pay its import tax.
+    from rich.console import Console
+
+    return Console()
 
 
 @app.command()
 def version() -> None:
     """Показать версию приложения."""
-    console.print("Сканер криптоконтейнеров v0.1.0")
+    _console().print("Сканер криптоконтейнеров v0.1.0")
 
 
 @app.command()
 def scan(
     path: Path = typer.Argument(..., help="Путь к диску, каталогу или файлу"),
+    workers: int = typer.Option(0, "--workers", "-w", help="Число процессов сканирования (0 — по числу ядер)"),
 ) -> None:
     """Сканировать диск, каталог или файл на наличие контейнеров."""
+    import os
+
+    from rich.table import Table
+
+    from ..core.models import ContainerType
+    from ..detector.scanner import scan_path_for_containers
+
+    console = _console()
     console.print(f"Сканирование: {path}")
-    results = scan_path_for_containers(path)
+    results = scan_path_for_containers(path, workers=workers or os.cpu_count() or 1)
     if not results:
         console.print("Контейнеры не обнаружены.")
         return
@@ -3,18 +3,60 @@ from __future__ import annotations
 
 from pathlib import Path
 import hashlib
-from typing import BinaryIO
+import json
+import os
+from typing import BinaryIO, Optional
 
-BUFFER_SIZE = 1024 * 1024
+BUFFER_SIZE = 8 * 1024 * 1024
+
+_HASH_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "cryptocontainer_lab" / "sha256.json"
+)
+_hash_cache: Optional[dict[str, str]] = None
+
+
+def _load_hash_cache() -> dict[str, str]:
+    global _hash_cache
+    if _hash_cache is None:
+        try:
+            _hash_cache = json.loads(_HASH_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _hash_cache = {}
+    return _hash_cache
+
+
+def _store_hash_cache(cache: dict[str, str]) -> None:
+    try:
+        ensure_directory(_HASH_CACHE_PATH.parent)
+        _HASH_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        # The cache is purely an optimization; hashing still succeeded.
+        pass
 
 
 def compute_sha256(path: Path) -> str:
-    """Compute SHA-256 for a file using buffered reads."""
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(BUFFER_SIZE), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    """Compute SHA-256 for a file, reusing cached digests for unchanged files.
+
+    Digests are remembered across invocations in a small user-level cache
+    keyed by ``(st_dev, st_ino, st_size, st_mtime_ns)``, so re-registering
+    the same read-only image skips the full-file hash entirely.
+    """
+    try:
+        stat_result = path.stat()
+        cache_key = f"{stat_result.st_dev}:{stat_result.st_ino}:{stat_result.st_size}:{stat_result.st_mtime_ns}"
+    except OSError:
+        cache_key = None
+    cache = _load_hash_cache()
+    if cache_key is not None and cache_key in cache:
+        return cache[cache_key]
+    # buffering=0 exposes the raw file so file_digest's readinto loop is not
+    # double-buffered through an intermediate BufferedReader.
+    with path.open("rb", buffering=0) as handle:
+        digest = hashlib.file_digest(handle, "sha256").hexdigest()
+    if cache_key is not None:
+        cache[cache_key] = digest
+        _store_hash_cache(cache)
+    return digest
 
 
 def read_block(handle: BinaryIO, size: int) -> bytes:
@@ -17,7 +17,7 @@ class ContainerType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerCandidate:
     """Potential cryptographic container located during scanning."""
 
@@ -2,16 +2,25 @@
 from __future__ import annotations
 
 import math
+from collections import Counter
 
+try:  # NumPy is optional (the ``accel`` extra); the stdlib path stays correct without it.
+    import numpy as _np
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
 
-def estimate_entropy(data: bytes) -> float:
+
+def estimate_entropy(data: bytes | memoryview) -> float:
     """Rudimentary entropy estimate using Shannon formula."""
-    if not data:
-        return 0.0
-    histogram = {byte: data.count(byte) for byte in set(data)}
     total = len(data)
+    if not total:
+        return 0.0
+    if _np is not None:
+        counts = _np.bincount(_np.frombuffer(data, dtype=_np.uint8), minlength=256)
+        probabilities = counts[counts > 0] / total
+        return float(-(probabilities * _np.log2(probabilities)).sum())
     entropy = 0.0
-    for count in histogram.values():
+    for count in Counter(data).values():
         p = count / total
         entropy -= p * math.log2(p)
     return entropy
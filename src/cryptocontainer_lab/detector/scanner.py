@@ -1,11 +1,23 @@
 """Scanning utilities for locating cryptographic containers."""
 from __future__ import annotations
 
+import hashlib
+import itertools
+import mmap
 import os
+import queue
+import re
 import stat
+import threading
 import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import BinaryIO, Callable, Iterable, Optional
+
+try:  # Hyperscan is optional (the ``accel`` extra); scanning works without it.
+    import hyperscan as _hyperscan
+except ImportError:  # pragma: no cover - depends on the environment
+    _hyperscan = None
 
 from ..core.logging_utils import get_logger
 from ..core.models import ContainerCandidate, ContainerType
@@ -14,28 +26,178 @@ from ..detector.signatures import BITLOCKER_HEADER, DEFAULT_SCAN_OFFSETS, HEADER
 
 LOGGER = get_logger(__name__)
 
+# Signature table driving the multi-pattern scan: adding a signature here is
+# enough to have it picked up by every scanning entry point.
+_SIGNATURES: tuple[tuple[bytes, ContainerType, float, str], ...] = (
+    (BITLOCKER_HEADER, ContainerType.BITLOCKER, 0.9, "Сигнатура заголовка BitLocker (FVE-FS)."),
+    (LUKS_MAGIC, ContainerType.LUKS, 0.9, "Сигнатура заголовка LUKS."),
+)
+
+_MAX_SIGNATURE_LEN = max(len(pattern) for pattern, _, _, _ in _SIGNATURES)
+
+# Dedup keys pack the absolute offset and the signature index into one int
+# ((offset << _SIG_INDEX_BITS) | index): hashing a small int is cheaper than
+# hashing an (enum, offset) tuple and allocates nothing per hit.
+_SIG_INDEX_BITS = 2
 
-def _scan_block(block: bytes, offset: int, source_path: Path) -> Iterable[ContainerCandidate]:
-    """Analyze a block of bytes for known header patterns."""
-    if BITLOCKER_HEADER in block:
-        yield ContainerCandidate(
-            candidate_id=str(uuid.uuid4()),
-            source_path=source_path,
-            offset=offset + block.index(BITLOCKER_HEADER),
-            container_type=ContainerType.BITLOCKER,
-            confidence=0.9,
-            notes="Сигнатура заголовка BitLocker (FVE-FS).",
+# Well-known header locations; hits exactly on one of these offsets are more
+# trustworthy than a signature found mid-file.
+_ANCHOR_OFFSETS = frozenset(DEFAULT_SCAN_OFFSETS)
+_ANCHOR_CONFIDENCE = 0.95
+
+
+def _build_hyperscan_database():
+    """Compile the signature set into a Hyperscan database, if available."""
+    if _hyperscan is None:
+        return None
+    count = len(_SIGNATURES)
+    try:
+        database = _hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(pattern) for pattern, _, _, _ in _SIGNATURES],
+            ids=list(range(count)),
+            elements=count,
+            flags=[_hyperscan.HS_FLAG_SOM_LEFTMOST] * count,
         )
-    if LUKS_MAGIC in block:
-        yield ContainerCandidate(
-            candidate_id=str(uuid.uuid4()),
-            source_path=source_path,
-            offset=offset + block.index(LUKS_MAGIC),
-            container_type=ContainerType.LUKS,
-            confidence=0.9,
-            notes="Сигнатура заголовка LUKS.",
+    except _hyperscan.error:  # pragma: no cover - platform-specific
+        LOGGER.warning("Не удалось скомпилировать базу Hyperscan, используется запасной сканер.")
+        return None
+    return database
+
+
+_HS_DATABASE = _build_hyperscan_database()
+
+
+def _hs_collect_match(sig_index: int, start: int, end: int, flags: int, hits: list[tuple[int, int]]) -> None:
+    hits.append((sig_index, start))
+
+
+def _iter_signature_hits(block: bytes | mmap.mmap, start: int = 0) -> Iterable[tuple[int, int]]:
+    """Yield ``(signature_index, position)`` for every signature match in the block.
+
+    When Hyperscan is installed the whole signature set is matched in a
+    single SIMD-vectorized sweep; otherwise each needle is located with
+    ``bytes.find`` (C-level memmem), one sweep per signature.  In both cases
+    *all* matches are reported, not just the first one per pattern.
+    """
+    if _HS_DATABASE is not None:
+        hits: list[tuple[int, int]] = []
+        try:
+            _HS_DATABASE.scan(block, match_event_handler=_hs_collect_match, context=hits)
+        except TypeError:
+            hits = None  # type: ignore[assignment] - buffer type not accepted, use fallback
+        if hits is not None:
+            for sig_index, pos in hits:
+                if pos >= start:
+                    yield sig_index, pos
+            return
+    for sig_index, (pattern, _, _, _) in enumerate(_SIGNATURES):
+        pos = block.find(pattern, start)
+        while pos >= 0:
+            yield sig_index, pos
+            pos = block.find(pattern, pos + 1)
+
+
+# Candidate ids only have to be unique within a run. The salt and counter
+# are inherited as-is by forked pool workers, so the id also carries the
+# current pid to keep workers from reusing each other's numbering.
+_ID_SALT = uuid.uuid4().hex[:8]
+_ID_COUNTER = itertools.count()
+
+
+def _next_candidate_id() -> str:
+    """Return a cheap run-unique candidate id."""
+    return f"{os.getpid():x}-{_ID_SALT}-{next(_ID_COUNTER):x}"
+
+
+def _make_factory(
+    container_type: ContainerType, confidence: float, notes: str
+) -> Callable[[int, Path], ContainerCandidate]:
+    """Bind one signature's constant fields into a candidate factory."""
+
+    def factory(absolute: int, source_path: Path) -> ContainerCandidate:
+        return ContainerCandidate(
+            _next_candidate_id(),
+            source_path,
+            absolute,
+            container_type,
+            _ANCHOR_CONFIDENCE if absolute in _ANCHOR_OFFSETS else confidence,
+            notes,
         )
 
+    return factory
+
+
+# One prebuilt factory per signature: the hot path does a tuple index and a
+# call with two positional arguments instead of unpacking the signature row
+# and binding six keyword arguments per hit.
+_FACTORIES = tuple(
+    _make_factory(container_type, confidence, notes)
+    for _, container_type, confidence, notes in _SIGNATURES
+)
+
+
+def _candidate_from_hit(sig_index: int, absolute: int, source_path: Path) -> ContainerCandidate:
+    """Build a candidate for a signature hit at an absolute file offset."""
+    return _FACTORIES[sig_index](absolute, source_path)
+
+
+def _read_blocks(handle: BinaryIO, block_size: int, out_queue: "queue.Queue[bytes | Exception]") -> None:
+    """Producer loop: read blocks ahead of the scanning consumer.
+
+    An empty bytes object marks end-of-stream; read errors are forwarded to
+    the consumer through the queue instead of being raised in this thread.
+    """
+    try:
+        while True:
+            block = handle.read(block_size)
+            out_queue.put(block)
+            if not block:
+                return
+    except Exception as exc:  # noqa: BLE001 - re-raised on the consumer side
+        out_queue.put(exc)
+
+
+def _fadvise(handle: BinaryIO, advice: int) -> None:
+    """Pass access-pattern advice to the kernel, where supported."""
+    try:
+        os.posix_fadvise(handle.fileno(), 0, 0, advice)
+    except OSError:
+        pass
+
+
+# Regular files at least this large are split across worker processes.
+_PARALLEL_THRESHOLD = 256 * 1024 * 1024
+
+
+def _split_ranges(size: int, workers: int) -> list[tuple[int, int]]:
+    """Split ``[0, size)`` into mmap-aligned ``(start, length)`` ranges.
+
+    Each range is extended by the signature overlap so headers straddling a
+    boundary are still caught by the earlier range; duplicates from the
+    overlap are removed by the caller's ``(type, offset)`` dedup.
+    """
+    chunk = -(-size // workers)
+    chunk += -chunk % mmap.ALLOCATIONGRANULARITY
+    overlap = _MAX_SIGNATURE_LEN - 1
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    while start < size:
+        ranges.append((start, min(size - start, chunk + overlap)))
+        start += chunk
+    return ranges
+
+
+def _scan_range(path_str: str, start: int, length: int) -> list[tuple[int, int]]:
+    """Worker process: scan one mapped range of a file.
+
+    Returns ``(signature_index, absolute_offset)`` pairs so only small
+    tuples cross the process boundary.
+    """
+    with open(path_str, "rb") as handle:
+        with mmap.mmap(handle.fileno(), length, access=mmap.ACCESS_READ, offset=start) as mapped:
+            return [(sig_index, start + pos) for sig_index, pos in _iter_signature_hits(mapped)]
+
 
 def _veracrypt_confidence(file_path: Path, header_block: bytes) -> Optional[float]:
     """Return a confidence score for VeraCrypt/TrueCrypt candidates based on heuristics."""
@@ -53,100 +215,200 @@ def _veracrypt_confidence(file_path: Path, header_block: bytes) -> Optional[floa
     return 0.4
 
 
-def _is_reparse_point(path: Path) -> bool:
-    """Return True when the path is a Windows reparse point (junction, symlink, etc.)."""
-    try:
-        attributes = path.stat(follow_symlinks=False).st_file_attributes
-    except (AttributeError, OSError):
-        return False
-    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
-
-
 def _iter_files(root: Path) -> Iterable[Path]:
-    """Yield file paths inside the provided root."""
-    if root.is_dir():
-        visited: set[tuple[int, int]] = set()
-        for dirpath, dirnames, filenames in os.walk(root, topdown=True, followlinks=False):
-            safe_dirnames: list[str] = []
-            for dirname in dirnames:
-                candidate = Path(dirpath) / dirname
-                if candidate.is_symlink() or _is_reparse_point(candidate):
-                    continue
+    """Yield file paths inside the provided root.
+
+    Directory walking is built on ``os.scandir`` so the type, symlink and
+    reparse-point checks all come from the single ``stat`` cached on each
+    ``DirEntry`` instead of costing one syscall apiece per entry.
+    """
+    if not root.is_dir():
+        yield root
+        return
+    visited: set[tuple[int, int]] = set()
+    pending: list[str] = [str(root)]
+    while pending:
+        current = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
                 try:
-                    stat_result = candidate.stat(follow_symlinks=False)
+                    if entry.is_dir(follow_symlinks=False):
+                        stat_result = entry.stat(follow_symlinks=False)
+                        attributes = getattr(stat_result, "st_file_attributes", 0)
+                        if attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                            continue
+                        key = (stat_result.st_dev, stat_result.st_ino)
+                        if key in visited:
+                            continue
+                        visited.add(key)
+                        pending.append(entry.path)
+                    elif entry.is_dir():
+                        # Symlink or junction to a directory: never descend.
+                        continue
+                    else:
+                        yield Path(entry.path)
                 except OSError:
                     continue
-                key = (stat_result.st_dev, stat_result.st_ino)
-                if key in visited:
-                    continue
-                visited.add(key)
-                safe_dirnames.append(dirname)
-            dirnames[:] = safe_dirnames
-            for filename in filenames:
-                yield Path(dirpath) / filename
-        return
-    yield root
 
 
 def scan_file_for_containers(
     file_path: Path,
     block_size: int = 1024 * 1024,
+    workers: Optional[int] = None,
+    digest: Optional["hashlib._Hash"] = None,
 ) -> list[ContainerCandidate]:
-    """Scan a single file/device for container headers."""
+    """Scan a single file/device for container headers.
+
+    Large regular files are split into ranges scanned by ``workers``
+    processes (defaulting to the CPU count); pass ``workers=1`` to force a
+    sequential scan.
+
+    When ``digest`` is given (e.g. ``hashlib.sha256()``) it is updated with
+    the full file contents during the same pass, so callers that need both
+    an evidence hash and scan results read the file only once.
+    """
     discovered: list[ContainerCandidate] = []
-    seen: set[tuple[ContainerType, int]] = set()
-    max_signature_len = max(len(BITLOCKER_HEADER), len(LUKS_MAGIC))
-    overlap = max_signature_len - 1
-    with file_path.open("rb") as handle:
-        header_block = b""
-        for base_offset in DEFAULT_SCAN_OFFSETS:
-            handle.seek(base_offset)
-            block = handle.read(HEADER_WINDOW)
-            if base_offset == 0:
-                header_block = block
-            for candidate in _scan_block(block, base_offset, file_path):
-                key = (candidate.container_type, candidate.offset)
-                if key in seen:
-                    continue
-                seen.add(key)
-                discovered.append(candidate)
-
-        if not any(item.container_type in {ContainerType.VERACRYPT, ContainerType.TRUECRYPT} for item in discovered):
-            confidence = _veracrypt_confidence(file_path, header_block)
-            if confidence is not None:
-                note = (
-                    "Высокая энтропия заголовка и типичное расширение VeraCrypt/TrueCrypt."
-                    if confidence >= 0.6
-                    else "Типичное расширение VeraCrypt/TrueCrypt (эвристика)."
-                )
-                discovered.append(
-                    ContainerCandidate(
-                        candidate_id=str(uuid.uuid4()),
-                        source_path=file_path,
-                        offset=0,
-                        container_type=ContainerType.VERACRYPT,
-                        confidence=confidence,
-                        notes=note,
-                    )
+    seen: set[int] = set()
+    overlap = _MAX_SIGNATURE_LEN - 1
+    header_block = b""
+
+    found_veracrypt = False
+
+    def collect(sig_index: int, absolute: int) -> None:
+        nonlocal found_veracrypt
+        key = (absolute << _SIG_INDEX_BITS) | sig_index
+        if key in seen:
+            return
+        seen.add(key)
+        candidate = _candidate_from_hit(sig_index, absolute, file_path)
+        if candidate.container_type is ContainerType.VERACRYPT or candidate.container_type is ContainerType.TRUECRYPT:
+            found_veracrypt = True
+        discovered.append(candidate)
+
+    # Only regular files can be skipped by size: block devices report
+    # st_size == 0 from stat() yet still hold data, so they must fall
+    # through to open() and the streaming path.
+    try:
+        stat_result = file_path.stat()
+        is_empty_regular = stat.S_ISREG(stat_result.st_mode) and stat_result.st_size == 0
+    except OSError:
+        is_empty_regular = False
+
+    if not is_empty_regular:
+        with file_path.open("rb") as handle:
+            # The whole file is read front to back exactly once: tell the
+            # kernel so it widens readahead, and drop the pages afterwards so
+            # a large disk image does not evict more useful cache entries.
+            has_fadvise = hasattr(os, "posix_fadvise")
+            if has_fadvise:
+                _fadvise(handle, os.POSIX_FADV_SEQUENTIAL)
+            try:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                mapped = None
+
+            if workers is None:
+                workers = os.cpu_count() or 1
+
+            if mapped is not None and len(mapped) >= _PARALLEL_THRESHOLD and workers > 1:
+                # Large image: fan the ranges out to worker processes, each of
+                # which maps and sweeps its own slice of the file.
+                header_block = mapped[:HEADER_WINDOW]
+                size = len(mapped)
+                if digest is not None:
+                    digest.update(mapped)
+                mapped.close()
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(_scan_range, str(file_path), start, length)
+                        for start, length in _split_ranges(size, workers)
+                    ]
+                    for future in futures:
+                        for sig_index, absolute in future.result():
+                            collect(sig_index, absolute)
+            elif mapped is not None:
+                # Zero-copy path: the signature sweep runs directly over the page
+                # cache, so no block is ever materialized as a bytes object.
+                with mapped:
+                    madv_sequential = getattr(mmap, "MADV_SEQUENTIAL", None)
+                    if madv_sequential is not None:
+                        try:
+                            mapped.madvise(madv_sequential)
+                        except OSError:
+                            pass
+                    header_block = mapped[:HEADER_WINDOW]
+                    if digest is not None:
+                        digest.update(mapped)
+                    for sig_index, pos in _iter_signature_hits(mapped):
+                        collect(sig_index, pos)
+            else:
+                # Fallback for targets that cannot be mapped (pipes, some raw
+                # devices, empty files): stream fixed-size blocks with an overlap.
+                # A prefetch thread keeps the next read in flight while the
+                # current block is being matched, so I/O and scanning overlap.
+                offset = 0
+                tail = b""
+                blocks: queue.Queue[bytes | Exception] = queue.Queue(maxsize=2)
+                reader = threading.Thread(
+                    target=_read_blocks, args=(handle, block_size, blocks), daemon=True
                 )
+                reader.start()
+                try:
+                    while True:
+                        block = blocks.get()
+                        if isinstance(block, Exception):
+                            raise block
+                        if not block:
+                            break
+                        if offset == 0:
+                            header_block = block[:HEADER_WINDOW]
+                        if digest is not None:
+                            digest.update(block)
+                        # Headers straddling a block boundary are caught by a
+                        # tiny tail+head window; the block itself is scanned
+                        # in place, so no per-block megabyte splice is copied.
+                        if tail:
+                            boundary = tail + block[:overlap]
+                            for sig_index, pos in _iter_signature_hits(boundary):
+                                collect(sig_index, offset - len(tail) + pos)
+                        for sig_index, pos in _iter_signature_hits(block):
+                            collect(sig_index, offset + pos)
+                        tail = block[-overlap:] if overlap > 0 else b""
+                        offset += len(block)
+                finally:
+                    # Unblock the producer if scanning stopped early, then reap it.
+                    while reader.is_alive():
+                        try:
+                            blocks.get(timeout=0.1)
+                        except queue.Empty:
+                            continue
+                    reader.join()
 
-        handle.seek(0)
-        offset = 0
-        tail = b""
-        while True:
-            block = handle.read(block_size)
-            if not block:
-                break
-            combined = tail + block
-            base_offset = offset - len(tail)
-            for candidate in _scan_block(combined, base_offset, file_path):
-                key = (candidate.container_type, candidate.offset)
-                if key in seen:
-                    continue
-                seen.add(key)
-                discovered.append(candidate)
-            tail = block[-overlap:] if overlap > 0 else b""
-            offset += len(block)
+            if has_fadvise:
+                _fadvise(handle, os.POSIX_FADV_DONTNEED)
+
+    if not found_veracrypt:
+        confidence = _veracrypt_confidence(file_path, header_block)
+        if confidence is not None:
+            note = (
+                "Высокая энтропия заголовка и типичное расширение VeraCrypt/TrueCrypt."
+                if confidence >= 0.6
+                else "Типичное расширение VeraCrypt/TrueCrypt (эвристика)."
+            )
+            discovered.append(
+                ContainerCandidate(
+                    candidate_id=_next_candidate_id(),
+                    source_path=file_path,
+                    offset=0,
+                    container_type=ContainerType.VERACRYPT,
+                    confidence=confidence,
+                    notes=note,
+                )
+            )
     return discovered
 
 
@@ -156,22 +418,20 @@ def scan_path_for_containers(
     on_progress: Optional[Callable[[Path], None]] = None,
     on_result: Optional[Callable[[ContainerCandidate], None]] = None,
     on_error: Optional[Callable[[Path, Exception], None]] = None,
+    workers: int = 1,
 ) -> list[ContainerCandidate]:
-    """Scan files inside the root path for container signatures."""
+    """Scan files inside the root path for container signatures.
+
+    With ``workers`` greater than one, files are scanned concurrently by a
+    process pool; callbacks still fire on the calling thread, so GUI and
+    logging consumers behave as in the sequential case.
+    """
     if not root.exists():
         raise FileNotFoundError(f"Путь не найден: {root}")
 
     results: list[ContainerCandidate] = []
-    for file_path in _iter_files(root):
-        if on_progress:
-            on_progress(file_path)
-        try:
-            candidates = scan_file_for_containers(file_path, block_size=block_size)
-        except Exception as exc:  # noqa: BLE001 - continue scanning other files
-            LOGGER.warning("Не удалось просканировать %s: %s", file_path, exc)
-            if on_error:
-                on_error(file_path, exc)
-            continue
+
+    def report(candidates: Iterable[ContainerCandidate]) -> None:
         for candidate in candidates:
             results.append(candidate)
             if on_result:
@@ -184,5 +444,38 @@ def scan_path_for_containers(
                     candidate.source_path,
                     candidate.offset,
                 )
+
+    def report_error(file_path: Path, exc: Exception) -> None:
+        LOGGER.warning("Не удалось просканировать %s: %s", file_path, exc)
+        if on_error:
+            on_error(file_path, exc)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures: dict[Future[list[ContainerCandidate]], Path] = {}
+            for file_path in _iter_files(root):
+                if on_progress:
+                    on_progress(file_path)
+                # Per-file scans stay sequential (workers=1): the pool
+                # already keeps every core busy with one file each.
+                futures[executor.submit(scan_file_for_containers, file_path, block_size, 1)] = file_path
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    candidates = future.result()
+                except Exception as exc:  # noqa: BLE001 - continue scanning other files
+                    report_error(file_path, exc)
+                    continue
+                report(candidates)
+    else:
+        for file_path in _iter_files(root):
+            if on_progress:
+                on_progress(file_path)
+            try:
+                candidates = scan_file_for_containers(file_path, block_size=block_size)
+            except Exception as exc:  # noqa: BLE001 - continue scanning other files
+                report_error(file_path, exc)
+                continue
+            report(candidates)
     LOGGER.info("Сканирование завершено. Найдено контейнеров: %d", len(results))
     return results
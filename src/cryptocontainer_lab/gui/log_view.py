@@ -2,27 +2,40 @@
 from __future__ import annotations
 
 import html
+from collections import deque
 from typing import Iterable, Optional
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+# How long appended messages may sit in the buffer before being flushed.
+_FLUSH_INTERVAL_MS = 50
 
-class LogView(QtWidgets.QTextEdit):
+
+class LogView(QtWidgets.QPlainTextEdit):
     """Read-only text area that accepts log messages.
 
-    The widget keeps a rolling buffer of log lines to avoid unbounded
-    memory growth. Messages can be appended individually or in bulk.
+    Messages are buffered and flushed to the document in timed batches, so a
+    burst of log lines costs one layout pass instead of one per line.  The
+    rolling buffer is enforced natively through the document's maximum block
+    count, which trims old lines without any cursor walking.
     """
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None, max_lines: int = 500) -> None:
         super().__init__(parent)
         self._max_lines = max_lines
+        self._pending: deque[str] = deque(maxlen=max_lines)
         self.setReadOnly(True)
-        self.setLineWrapMode(QtWidgets.QTextEdit.LineWrapMode.NoWrap)
+        self.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
         self.setFont(QtGui.QFont("Monospace"))
         self.document().setDefaultStyleSheet("pre { margin: 0; }")
+        self.document().setMaximumBlockCount(max_lines)
         self.setPlaceholderText("Здесь будут появляться сообщения журнала…")
 
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
+
     @property
     def max_lines(self) -> int:
         """Return the maximum number of lines retained in the buffer."""
@@ -32,31 +45,34 @@ class LogView(QtWidgets.QTextEdit):
     @max_lines.setter
     def max_lines(self, value: int) -> None:
         self._max_lines = max(1, value)
-        self._trim()
+        self._pending = deque(self._pending, maxlen=self._max_lines)
+        self.document().setMaximumBlockCount(self._max_lines)
 
     def append_message(self, message: str, level: str = "INFO") -> None:
-        """Append a message with a simple level prefix."""
+        """Queue a message with a simple level prefix."""
 
         timestamp = QtCore.QDateTime.currentDateTime().toString(QtCore.Qt.DateFormat.ISODate)
-        colored = self._format_line(timestamp, level.upper(), message)
-        self.append(colored)
-        self._trim()
+        self._pending.append(self._format_line(timestamp, level.upper(), message))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def extend(self, messages: Iterable[str], level: str = "INFO") -> None:
-        """Append multiple messages in a single update."""
-
-        for msg in messages:
-            self.append_message(msg, level=level)
+        """Queue multiple messages for a single batched update."""
 
-    def _trim(self) -> None:
-        """Ensure the buffer does not exceed ``max_lines``."""
-
-        doc = self.document()
-        while doc.blockCount() > self._max_lines:
-            cursor = QtGui.QTextCursor(doc.begin())
-            cursor.select(QtGui.QTextCursor.SelectionType.BlockUnderCursor)
-            cursor.removeSelectedText()
-            cursor.deleteChar()
+        timestamp = QtCore.QDateTime.currentDateTime().toString(QtCore.Qt.DateFormat.ISODate)
+        level = level.upper()
+        self._pending.extend(self._format_line(timestamp, level, msg) for msg in messages)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Append everything queued since the last flush in one document edit."""
+
+        if not self._pending:
+            return
+        batch = "".join(self._pending)
+        self._pending.clear()
+        self.appendHtml(batch)
 
     @staticmethod
     def _format_line(timestamp: str, level: str, message: str) -> str:
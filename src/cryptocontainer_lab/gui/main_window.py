@@ -1,24 +1,31 @@
 """Main window definition for the PyQt GUI."""
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import Optional
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
-from ..core.models import ContainerCandidate, ContainerType
+from ..core.models import ContainerCandidate
 from ..detector.scanner import scan_path_for_containers
 from .log_view import LogView
+from .results_model import CandidateModel
 
 
 class ScanWorker(QtCore.QObject):
     """Background worker for disk scanning."""
 
     progress = QtCore.pyqtSignal(str)
-    found = QtCore.pyqtSignal(object)
+    found_many = QtCore.pyqtSignal(list)
     error = QtCore.pyqtSignal(str)
     finished = QtCore.pyqtSignal(int)
 
+    # Results are delivered in batches so the GUI thread handles one queued
+    # signal per chunk instead of one per candidate.
+    _BATCH_SIZE = 50
+    _BATCH_INTERVAL = 0.1  # seconds
+
     def __init__(self, target: Path, min_confidence: float) -> None:
         super().__init__()
         self._target = target
@@ -29,6 +36,15 @@ class ScanWorker(QtCore.QObject):
         """Execute scan in a background thread."""
         try:
             count = 0
+            batch: list[ContainerCandidate] = []
+            last_flush = time.monotonic()
+
+            def flush() -> None:
+                nonlocal batch, last_flush
+                if batch:
+                    self.found_many.emit(batch)
+                    batch = []
+                last_flush = time.monotonic()
 
             def handle_progress(path: Path) -> None:
                 self.progress.emit(f"Сканирование: {path}")
@@ -38,7 +54,9 @@ class ScanWorker(QtCore.QObject):
                 if candidate.confidence <= self._min_confidence:
                     return
                 count += 1
-                self.found.emit(candidate)
+                batch.append(candidate)
+                if len(batch) >= self._BATCH_SIZE or time.monotonic() - last_flush >= self._BATCH_INTERVAL:
+                    flush()
 
             def handle_error(path: Path, exc: Exception) -> None:
                 self.error.emit(f"Не удалось прочитать {path}: {exc}")
@@ -49,6 +67,7 @@ class ScanWorker(QtCore.QObject):
                 on_result=handle_result,
                 on_error=handle_error,
             )
+            flush()
             self.finished.emit(count)
         except Exception as exc:  # noqa: BLE001 - surface to user
             self.error.emit(str(exc))
@@ -84,15 +103,21 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._status_label = QtWidgets.QLabel("Готово к сканированию.")
 
-        self._results_table = QtWidgets.QTableWidget()
+        self._results_model = CandidateModel(self)
+        self._results_table = QtWidgets.QTableView()
+        self._results_table.setModel(self._results_model)
         self._results_table.setAlternatingRowColors(True)
         self._results_table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self._results_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectItems)
         self._results_table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
         self._results_table.horizontalHeader().setStretchLastSection(True)
+        # Fixed row heights: never let the view measure every row's contents
+        # while results are streaming in.
+        vertical_header = self._results_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(22)
         self._results_table.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self._results_table.customContextMenuRequested.connect(self._show_results_context_menu)
-        self._apply_table_headers()
         self._copy_shortcut: Optional[QtGui.QShortcut] = None
         self._setup_copy_shortcut()
 
@@ -120,11 +145,6 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._log_view.append_message("Готово. Выберите диск или файл для сканирования.")
 
-    def _apply_table_headers(self) -> None:
-        headers = ["Тип", "Путь", "Смещение (байт)", "Уверенность", "Примечание"]
-        self._results_table.setColumnCount(len(headers))
-        self._results_table.setHorizontalHeaderLabels(headers)
-
     def _select_directory(self) -> None:
         path = QtWidgets.QFileDialog.getExistingDirectory(self, "Выбор диска или папки")
         if path:
@@ -142,7 +162,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         target = Path(raw_path)
-        self._results_table.setRowCount(0)
+        self._results_model.clear()
         self._status_label.setText("Сканирование запущено…")
         self._log_view.append_message(f"Запуск сканирования: {target}")
         self._scan_button.setEnabled(False)
@@ -153,7 +173,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._scan_thread.started.connect(self._scan_worker.run)
         self._scan_worker.progress.connect(self._log_view.append_message)
-        self._scan_worker.found.connect(self._append_result)
+        self._scan_worker.found_many.connect(self._append_results)
         self._scan_worker.error.connect(lambda msg: self._log_view.append_message(msg, level="WARNING"))
         self._scan_worker.finished.connect(self._scan_finished)
         self._scan_worker.finished.connect(self._scan_thread.quit)
@@ -181,12 +201,15 @@ class MainWindow(QtWidgets.QMainWindow):
         menu.exec(self._results_table.viewport().mapToGlobal(position))
 
     def _copy_selected_cells(self) -> None:
-        items = self._results_table.selectedItems()
-        if not items:
+        selection = self._results_table.selectionModel()
+        if selection is None:
+            return
+        indexes = selection.selectedIndexes()
+        if not indexes:
             return
         rows: dict[int, dict[int, str]] = {}
-        for item in items:
-            rows.setdefault(item.row(), {})[item.column()] = item.text()
+        for index in indexes:
+            rows.setdefault(index.row(), {})[index.column()] = str(index.data() or "")
         lines = []
         for row in sorted(rows):
             cols = rows[row]
@@ -194,27 +217,8 @@ class MainWindow(QtWidgets.QMainWindow):
             lines.append(line)
         QtWidgets.QApplication.clipboard().setText("\n".join(lines))
 
-    def _append_result(self, candidate: ContainerCandidate) -> None:
-        type_labels = {
-            ContainerType.BITLOCKER: "BitLocker",
-            ContainerType.LUKS: "LUKS",
-            ContainerType.VERACRYPT: "VeraCrypt/TrueCrypt",
-            ContainerType.TRUECRYPT: "TrueCrypt",
-            ContainerType.UNKNOWN: "Неизвестно",
-        }
-        row = self._results_table.rowCount()
-        self._results_table.insertRow(row)
-        values = [
-            type_labels.get(candidate.container_type, candidate.container_type.value),
-            str(candidate.source_path),
-            str(candidate.offset),
-            f"{candidate.confidence:.2f}",
-            candidate.notes,
-        ]
-        for col, value in enumerate(values):
-            item = QtWidgets.QTableWidgetItem(value)
-            item.setFlags(item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-            self._results_table.setItem(row, col, item)
+    def _append_results(self, batch: list) -> None:
+        self._results_model.extend(batch)
 
     def _scan_finished(self, count: int) -> None:
         self._status_label.setText(f"Сканирование завершено. Найдено: {count}.")
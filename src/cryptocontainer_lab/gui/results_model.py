@@ -0,0 +1,89 @@
+"""Table model exposing scan results to the Qt view."""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from PyQt6 import QtCore
+
+from ..core.models import ContainerCandidate, ContainerType
+
+_TYPE_LABELS = {
+    ContainerType.BITLOCKER: "BitLocker",
+    ContainerType.LUKS: "LUKS",
+    ContainerType.VERACRYPT: "VeraCrypt/TrueCrypt",
+    ContainerType.TRUECRYPT: "TrueCrypt",
+    ContainerType.UNKNOWN: "Неизвестно",
+}
+
+_HEADERS = ("Тип", "Путь", "Смещение (байт)", "Уверенность", "Примечание")
+
+# One display accessor per column; rows are formatted lazily, only for the
+# cells the view actually asks about.
+_COLUMNS = (
+    lambda c: _TYPE_LABELS.get(c.container_type, c.container_type.value),
+    lambda c: str(c.source_path),
+    lambda c: str(c.offset),
+    lambda c: f"{c.confidence:.2f}",
+    lambda c: c.notes,
+)
+
+
+class CandidateModel(QtCore.QAbstractTableModel):
+    """Read-only table model backed by a plain list of candidates.
+
+    Unlike a ``QTableWidget`` there are no per-cell item objects: the view
+    pulls display strings on demand straight from the ``ContainerCandidate``
+    dataclasses, and batches of new rows are announced with a single
+    ``beginInsertRows``/``endInsertRows`` pair.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: list[ContainerCandidate] = []
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role != QtCore.Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return _COLUMNS[index.column()](self._rows[index.row()])
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and orientation == QtCore.Qt.Orientation.Horizontal:
+            return _HEADERS[section]
+        return None
+
+    def extend(self, candidates: list[ContainerCandidate]) -> None:
+        """Append a batch of candidates as a single row insertion."""
+
+        if not candidates:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(candidates) - 1)
+        self._rows.extend(candidates)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+    def candidate_at(self, row: int) -> ContainerCandidate:
+        """Return the candidate behind the given row."""
+
+        return self._rows[row]